@@ -8,12 +8,13 @@ This example shows how to:
 
 import asyncio
 
-from core.dependencies import qa_engine
+from core.dependencies import qa_engine, warmup
 
 
 async def main():
     """Demonstrate non-streaming (complete) response."""
-    # Initialize the QA engine
+    # Initialize the QA engine and its dependencies before the first question
+    warmup()
     engine = qa_engine()
 
     # Example question
@@ -35,4 +36,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Prefer uvloop's faster event loop when it's available (not on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -8,14 +8,29 @@ This example shows how to:
 """
 
 import asyncio
+import sys
 
-from core.dependencies import qa_engine
+from core.axiom_store import Axiom, AxiomId
+from core.dependencies import qa_engine, warmup
 from core.qa_engine import CitationContent, TextContent
 
+# Streamed text is written to the terminal once this many characters are
+# buffered, or earlier at the end of a line or sentence
+FLUSH_THRESHOLD = 64
+
+
+def flush_text(buffer: list[str]) -> None:
+    """Write the buffered text to the terminal and clear the buffer."""
+    if buffer:
+        sys.stdout.write("".join(buffer))
+        sys.stdout.flush()
+        buffer.clear()
+
 
 async def main():
     """Demonstrate streaming response with citation handling."""
-    # Initialize the QA engine
+    # Initialize the QA engine and its dependencies before the first question
+    warmup()
     engine = qa_engine()
 
     # Example question
@@ -31,23 +46,39 @@ async def main():
     print("-" * 80)
 
     # Collect citations for reference section
-    citations = []
+    citations: list[Axiom] = []
+    seen_axiom_ids: set[AxiomId] = set()
+
+    # Text waiting to be written to the terminal
+    buffer: list[str] = []
+    buffered_length = 0
 
     # Stream the response
     async for chunk in engine.invoke_streaming(question):
         match chunk:
             case TextContent():
-                # Print text content as it arrives
-                print(chunk.content, end="", flush=True)
+                # Buffer text content and write it out in larger pieces
+                buffer.append(chunk.content)
+                buffered_length += len(chunk.content)
+                if buffered_length >= FLUSH_THRESHOLD or chunk.content.endswith(
+                    ("\n", ".", "?")
+                ):
+                    flush_text(buffer)
+                    buffered_length = 0
             case CitationContent():
+                # Write pending text first so the citation keeps its position
+                flush_text(buffer)
+                buffered_length = 0
                 # Print citation with visual styling
                 axiom = chunk.axiom
                 # Use ANSI color codes: cyan and bold for citations
                 print(f"\033[1;36m[{axiom.id}]\033[0m", end="", flush=True)
                 # Collect citation for reference section
-                if axiom not in citations:
+                if axiom.id not in seen_axiom_ids:
+                    seen_axiom_ids.add(axiom.id)
                     citations.append(axiom)
 
+    flush_text(buffer)
     print("\n" + "-" * 80)
     # Display references section if there are citations
     if citations:
@@ -64,4 +95,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Prefer uvloop's faster event loop when it's available (not on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -1,14 +1,19 @@
-import json
+import re
 from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import NewType
 
-from pydantic import BaseModel
+from pydantic import TypeAdapter
 
 AxiomId = NewType("AxiomId", str)
 
+# Matches the axiom placeholders in the constitution template, e.g. "{{ id }}"
+_AXIOM_PLACEHOLDER = re.compile(
+    r"\{\{\s*(id|subject|object|link|conditions|description|amendments)\s*\}\}"
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Axiom:
     id: AxiomId
     subject: str
@@ -19,10 +24,33 @@ class Axiom:
     category: str
 
 
+# Typed JSON decoder for the constitution file
+_AXIOM_LIST = TypeAdapter(list[Axiom])
+
+
+def render_axiom(template: str, axiom: Axiom) -> str:
+    """Render a single axiom into the constitution template."""
+    # Map axiom fields to template variables
+    values = {
+        "id": axiom.id,
+        "subject": axiom.subject,
+        "object": axiom.entity,  # Map entity to object
+        "link": axiom.trigger,  # Map trigger to link
+        "conditions": axiom.conditions,
+        "description": axiom.description,
+        # Map category to amendments
+        "amendments": f"Category: {axiom.category}",
+    }
+
+    # Replace all template variables in a single pass over the template
+    return _AXIOM_PLACEHOLDER.sub(lambda match: values[match.group(1)], template)
+
+
 class AxiomStore:
     def __init__(self, axioms: Iterable[Axiom], /):
         super().__init__()
         self._axioms: dict[AxiomId, Axiom] = {axiom.id: axiom for axiom in axioms}
+        self._formatted_sections: dict[str, str] = {}
 
     def get(self, id: AxiomId) -> Axiom | None:
         return self._axioms.get(id)
@@ -30,34 +58,31 @@ class AxiomStore:
     def list(self) -> list[Axiom]:
         return list(self._axioms.values())
 
+    def formatted_sections(self, template: str) -> str:
+        """
+        Render every axiom with the given template.
 
-def load_from_json(json_data: str) -> AxiomStore:
-    class RawAxiom(BaseModel):
-        id: str
-        subject: str
-        entity: str
-        trigger: str
-        conditions: str
-        description: str
-        category: str
+        The axioms never change once the store is built, so the rendered text is
+        cached per template and only computed on the first call.
 
-        class Config:
-            extra = "ignore"  # Ignore extra fields like 'object', 'link', 'amendments'
+        Args:
+            template: Constitution template with "{{ field }}" placeholders.
 
-    parsed_axioms = {
-        AxiomId(axiom["id"]): RawAxiom.model_validate(axiom)
-        for axiom in json.loads(json_data)
-    }
+        Returns:
+            The rendered sections of all axioms, one after another.
+        """
+        if (sections := self._formatted_sections.get(template)) is not None:
+            return sections
 
-    return AxiomStore(
-        Axiom(
-            id=axiom_id,
-            subject=parsed_axiom.subject,
-            entity=parsed_axiom.entity,
-            trigger=parsed_axiom.trigger,
-            conditions=parsed_axiom.conditions,
-            description=parsed_axiom.description,
-            category=parsed_axiom.category,
+        sections = "".join(
+            f"{render_axiom(template, axiom)}\n" for axiom in self._axioms.values()
         )
-        for axiom_id, parsed_axiom in parsed_axioms.items()
-    )
+
+        self._formatted_sections[template] = sections
+        return sections
+
+
+def load_from_json(json_data: str | bytes) -> AxiomStore:
+    # Parsed and validated in a single pass by pydantic-core. Extra fields like
+    # 'object', 'link' or 'amendments' are ignored.
+    return AxiomStore(_AXIOM_LIST.validate_json(json_data))
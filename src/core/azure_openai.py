@@ -17,12 +17,169 @@ The AzureOpenAIChatClient automatically reads from these environment variables:
 - AZURE_OPENAI_API_VERSION: The API version to use for requests
   (optional, uses default if not set)
 
+- AZURE_OPENAI_API_KEY: API key for the deployment
+  (optional, Entra ID authentication is used if not set)
+- AZURE_OPENAI_TOKEN_ENDPOINT: Scope of the Entra ID tokens
+  (optional, defaults to the Cognitive Services scope)
+
+Entra ID authentication uses a bearer token provider shared per credential and
+scope, so tokens are cached and refreshed in the background shortly before
+they expire instead of being fetched for every client or on the request path.
+
 For more information, see:
 https://github.com/microsoft/agent-framework/blob/main/python/samples/getting_started/chat_client/azure_chat_client.py
 """
 
-from agent_framework.azure import AzureOpenAIChatClient
-from azure.core.credentials import TokenCredential
+import asyncio
+import time
+from functools import cache
+
+from agent_framework.azure import AzureOpenAIChatClient, AzureOpenAISettings
+from azure.core.credentials import AccessToken, TokenCredential
+
+# Default token scope for Azure OpenAI requests
+COGNITIVE_SERVICES_SCOPE = "https://cognitiveservices.azure.com/.default"
+
+# Tokens expiring within this many seconds are refreshed in the background
+TOKEN_REFRESH_MARGIN = 300
+# Seconds to wait after a failed background refresh before trying again
+TOKEN_REFRESH_RETRY_DELAY = 30
+
+
+class BearerTokenProvider:
+    """
+    Async bearer token provider that keeps token refreshes off the request path.
+
+    The token is cached and handed out as is while it is valid. Once it is
+    about to expire, a new one is fetched in the background and the current
+    token is still returned. A failed background refresh is retried after a
+    short delay rather than by every following request. Requests only wait for
+    the credential when there is no valid token at all, e.g. on the first
+    request. Credentials are synchronous (the Azure CLI credential starts a
+    process), so they are called in a worker thread to keep the event loop
+    free.
+
+    Attributes:
+        token_credential (TokenCredential): Credential the tokens come from.
+        scope (str): Scope the tokens are requested for.
+    """
+
+    def __init__(self, token_credential: TokenCredential, scope: str):
+        """
+        Initialize the token provider.
+
+        Args:
+            token_credential: Azure token credential for authentication
+            scope: Scope the tokens are requested for
+        """
+        self.token_credential = token_credential
+        self.scope = scope
+        self._token: AccessToken | None = None
+        # Refresh in progress, shared by every request that needs its result
+        self._refresh: asyncio.Task[AccessToken] | None = None
+        # Time of the last failed refresh, None after a successful one
+        self._refresh_failed_at: float | None = None
+
+    async def __call__(self) -> str:
+        """
+        Get a valid bearer token.
+
+        Returns:
+            Bearer token for the scope.
+        """
+        now = time.time()
+        token = self._token
+        if token is None or token.expires_on <= now:
+            token = await self._start_refresh()
+        elif token.expires_on - now <= TOKEN_REFRESH_MARGIN and (
+            self._refresh_failed_at is None
+            or now - self._refresh_failed_at >= TOKEN_REFRESH_RETRY_DELAY
+        ):
+            _ = self._start_refresh()
+        return token.token
+
+    def warmup(self) -> None:
+        """
+        Fetch the first token ahead of the first request.
+
+        The credential is called synchronously, so call this at startup before
+        any requests are served.
+        """
+        if self._token is None:
+            self._token = self.token_credential.get_token(self.scope)
+
+    def _start_refresh(self) -> asyncio.Task[AccessToken]:
+        """
+        Start fetching a new token unless a refresh is already in progress.
+
+        Returns:
+            Task resolving to the new token.
+        """
+        if self._refresh is None:
+            self._refresh = asyncio.create_task(self._refresh_token())
+            # A failed background refresh is retried after a delay, so its
+            # error is only raised to requests that wait for the token
+            self._refresh.add_done_callback(
+                lambda task: task.cancelled() or task.exception()
+            )
+        return self._refresh
+
+    async def _refresh_token(self) -> AccessToken:
+        """
+        Fetch a new token from the credential.
+
+        Returns:
+            The new token.
+        """
+        try:
+            self._token = await asyncio.to_thread(
+                self.token_credential.get_token, self.scope
+            )
+        except Exception:
+            self._refresh_failed_at = time.time()
+            raise
+        finally:
+            self._refresh = None
+
+        self._refresh_failed_at = None
+        return self._token
+
+
+@cache
+def bearer_token_provider(
+    token_credential: TokenCredential, scope: str = COGNITIVE_SERVICES_SCOPE, /
+) -> BearerTokenProvider:
+    """
+    Get the bearer token provider for a credential and scope.
+
+    The provider is shared per credential and scope, so clients created from
+    the same credential also share the token.
+
+    Args:
+        token_credential: Azure token credential for authentication
+        scope: Scope the tokens are requested for
+
+    Returns:
+        Provider returning a valid bearer token for Azure OpenAI
+    """
+    return BearerTokenProvider(token_credential, scope)
+
+
+def warmup_token(token_credential: TokenCredential, /) -> None:
+    """
+    Fetch the first Entra ID token for the configured token endpoint.
+
+    Does nothing when an API key is configured, as no tokens are needed then.
+
+    Args:
+        token_credential: Azure token credential for authentication
+    """
+    settings = AzureOpenAISettings()
+    if settings.api_key:
+        return
+
+    scope = settings.token_endpoint or COGNITIVE_SERVICES_SCOPE
+    bearer_token_provider(token_credential, scope).warmup()
 
 
 def azure_chat_openai_client(
@@ -32,10 +189,17 @@ def azure_chat_openai_client(
     """
     Create an Azure OpenAI chat client using the Microsoft Agent Framework.
 
-    The client automatically reads configuration from environment variables:
+    The client automatically reads configuration from environment variables
+    or the .env file:
     - AZURE_OPENAI_CHAT_DEPLOYMENT_NAME (required)
     - AZURE_OPENAI_ENDPOINT (required)
     - AZURE_OPENAI_API_VERSION (optional)
+    - AZURE_OPENAI_API_KEY (optional)
+    - AZURE_OPENAI_TOKEN_ENDPOINT (optional)
+
+    When an API key is configured, the client authenticates with it. Otherwise
+    it uses Entra ID tokens from the credential for the configured token
+    endpoint.
 
     Args:
         token_credential: Azure token credential for authentication
@@ -43,4 +207,12 @@ def azure_chat_openai_client(
     Returns:
         Configured AzureOpenAIChatClient instance
     """
-    return AzureOpenAIChatClient(credential=token_credential)
+    # Resolve the settings the same way the client does
+    settings = AzureOpenAISettings()
+    if settings.api_key:
+        return AzureOpenAIChatClient()
+
+    scope = settings.token_endpoint or COGNITIVE_SERVICES_SCOPE
+    return AzureOpenAIChatClient(
+        ad_token_provider=bearer_token_provider(token_credential, scope)
+    )
@@ -1,13 +1,32 @@
-from functools import cache, lru_cache
+import os
+from functools import cache
 
 from agent_framework import ChatAgent
 from azure.core.credentials import TokenCredential
 from azure.identity import AzureCliCredential
+from dotenv import dotenv_values
 
 from core.axiom_store import load_from_json
-from core.azure_openai import azure_chat_openai_client
+from core.azure_openai import azure_chat_openai_client, warmup_token
 from core.paths import root
-from core.qa_engine import QAEngine
+from core.qa_engine import QAEngine, load_prompt
+from core.rate_limiter import RateLimiter
+
+
+def setting(name: str) -> str | None:
+    """
+    Read a setting from the environment or the .env file.
+
+    Like the Azure OpenAI client settings, environment variables take precedence
+    over the .env file in the working directory.
+
+    Args:
+        name: Name of the setting, e.g. "AZURE_OPENAI_TOKENS_PER_MINUTE".
+
+    Returns:
+        The value of the setting, or None if it is not set.
+    """
+    return os.environ.get(name) or dotenv_values(".env").get(name)
 
 
 @cache
@@ -26,20 +45,68 @@ def azure_chat_openai():
 @cache
 def chat_agent() -> ChatAgent:
     """Create and cache the ChatAgent with system prompt."""
-    system_prompt = (root() / "src/core/prompts/system_prompt.md").read_text()
+    system_prompt = load_prompt("system_prompt.md")
     return azure_chat_openai().create_agent(instructions=system_prompt)
 
 
 @cache
 def axiom_store():
     """Load and cache the constitutional axioms from JSON data file."""
-    return load_from_json((root() / "data/constitution.json").read_text())
+    store = load_from_json((root() / "data/constitution.json").read_bytes())
+    # Render the constitution up front so the first question doesn't pay for it
+    store.formatted_sections(load_prompt("constitution.md"))
+    return store
+
 
+@cache
+def rate_limiter() -> RateLimiter | None:
+    """
+    Create and cache the rate limiter shared by every user of the chat client.
 
-@lru_cache(maxsize=32)
+    Set AZURE_OPENAI_REQUESTS_PER_MINUTE and/or AZURE_OPENAI_TOKENS_PER_MINUTE
+    (in the environment or .env) to the deployment's quota to spread model calls
+    instead of running into 429 responses. Without either, model calls are not
+    rate limited.
+    """
+    requests_per_minute = setting("AZURE_OPENAI_REQUESTS_PER_MINUTE")
+    tokens_per_minute = setting("AZURE_OPENAI_TOKENS_PER_MINUTE")
+    if not requests_per_minute and not tokens_per_minute:
+        return None
+    return RateLimiter(
+        requests_per_minute=int(requests_per_minute) if requests_per_minute else None,
+        tokens_per_minute=int(tokens_per_minute) if tokens_per_minute else None,
+    )
+
+
+@cache
 def qa_engine() -> QAEngine:
-    """Create and cache the QA Engine with Agent Framework client."""
+    """
+    Create and cache the QA Engine with Agent Framework client.
+
+    Set QA_ENGINE_MAX_CONCURRENCY (in the environment or .env) to limit how many
+    questions the shared engine sends to the model at the same time, and
+    QA_ENGINE_ANSWER_CACHE_SIZE to reply to that many recently asked questions
+    from memory.
+    """
+    max_concurrency = setting("QA_ENGINE_MAX_CONCURRENCY")
+    answer_cache_size = setting("QA_ENGINE_ANSWER_CACHE_SIZE")
     return QAEngine(
         agent=chat_agent(),
         axiom_store=axiom_store(),
+        max_concurrency=int(max_concurrency) if max_concurrency else None,
+        rate_limiter=rate_limiter(),
+        answer_cache_size=int(answer_cache_size) if answer_cache_size else None,
     )
+
+
+def warmup() -> None:
+    """
+    Create the cached dependencies, render the prompts and fetch the first token.
+
+    Without it, the first question pays for this work: the dependencies are
+    created when the engine is first requested, and the first Entra ID token
+    is fetched by the first model call. Call this at startup to keep that work
+    off the first request.
+    """
+    qa_engine().warmup()
+    warmup_token(credential())
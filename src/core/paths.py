@@ -1,6 +1,8 @@
+from functools import cache
 from pathlib import Path
 
 
 # I need to extract this function due to circular import issues
+@cache
 def root() -> Path:
     return Path(__file__).parents[2].resolve()
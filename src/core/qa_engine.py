@@ -5,17 +5,37 @@ This module provides the QAEngine class that handles question-answering
 using Azure OpenAI with constitution-based prompting via the Microsoft Agent Framework.
 """
 
-import json
+import asyncio
 import re
+from collections import OrderedDict
 from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, nullcontext
 from dataclasses import dataclass
-from typing import Literal
+from functools import cache
+from typing import Any, Literal
 
-from agent_framework import ChatAgent
+from agent_framework import ChatAgent, ChatMessage
 from pydantic import BaseModel, computed_field
 
-from core.axiom_store import Axiom, AxiomId, AxiomStore
+from core.axiom_store import Axiom, AxiomId, AxiomStore, load_from_json
 from core.paths import root
+from core.rate_limiter import RateLimiter, estimate_tokens
+
+
+@cache
+def load_prompt(name: str) -> str:
+    """
+    Load a prompt template from the prompts directory.
+
+    Prompt files don't change at runtime, so each one is read from disk only once.
+
+    Args:
+        name: File name of the prompt, e.g. "system_prompt.md".
+
+    Returns:
+        The content of the prompt file.
+    """
+    return (root() / "src/core/prompts" / name).read_text(encoding="utf-8")
 
 
 class Message(BaseModel):
@@ -103,6 +123,9 @@ class QAEngine:
         self,
         agent: ChatAgent,
         axiom_store: AxiomStore | None = None,
+        max_concurrency: int | None = None,
+        rate_limiter: RateLimiter | None = None,
+        answer_cache_size: int | None = None,
     ):
         """
         Initialize the QA Engine.
@@ -110,89 +133,92 @@ class QAEngine:
         Args:
             agent: ChatAgent instance for model inference.
             axiom_store: Optional storage for axioms (defaults to loading from file).
+            max_concurrency: Optional limit of model calls running at the same
+                time when the engine is shared by concurrent requests (defaults to
+                no limit).
+            rate_limiter: Optional limiter keeping model calls within the
+                deployment's requests and tokens per minute (defaults to no
+                limit).
+            answer_cache_size: Optional number of answers kept to reply to
+                repeated questions without calling the model (defaults to no
+                cache).
         """
         self.agent = agent
         self.axiom_store = axiom_store
+        self.rate_limiter = rate_limiter
+        self.max_concurrency = max_concurrency
+        # The agent is stateless between runs, so concurrent requests share it;
+        # the semaphore only bounds how many of them stream at once
+        self._model_call_slots: AbstractAsyncContextManager[Any] = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency else nullcontext()
+        )
+        # System message with the rendered constitution, identical for every
+        # question so the model service can cache it as a shared prompt prefix
+        self._constitution_prompt: str | None = None
+        # Answers to recent questions, least recently asked first
+        self.answer_cache_size = answer_cache_size
+        self._answer_cache: OrderedDict[str, list[TextContent | CitationContent]] = (
+            OrderedDict()
+        )
+
+    def warmup(self) -> None:
+        """
+        Load and render the prompts ahead of the first question.
+
+        Otherwise this happens on the first call to invoke or invoke_streaming.
+        """
+        self._load_and_format_constitution_prompt()
 
-    def _load_constitution_data(self) -> list[Axiom]:
+    def _load_constitution_data(self) -> AxiomStore:
         """
         Load constitution data from JSON file.
 
         Returns:
-            List of axioms from the constitution JSON file.
+            Store with the axioms from the constitution JSON file.
         """
-        constitution_file = root() / "data/constitution.json"
-        with open(constitution_file, encoding="utf-8") as f:
-            return [Axiom(**item) for item in json.load(f)]
+        return load_from_json((root() / "data/constitution.json").read_bytes())
 
     def _load_and_format_constitution(self) -> str:
         """
         Load the constitution template and format it with axiom data.
 
+        The axiom store caches the rendered text per template.
+
         Returns:
             Formatted constitution text with axioms.
         """
         # Load constitution template
-        constitution_template_file = root() / "src/core/prompts/constitution.md"
-        with open(constitution_template_file, encoding="utf-8") as f:
-            template_content = f.read()
-
-        # Load axiom data
-        axioms = self.axiom_store or self._load_constitution_data()
-        axiom_list = axioms.list() if isinstance(axioms, AxiomStore) else axioms
-
-        # Format constitution by replacing template variables for each axiom
-        formatted_constitution = ""
-        for axiom in axiom_list:
-            # Create a copy of the template for each axiom
-            axiom_section = template_content
-
-            # Replace template variables with axiom data
-            # Map axiom fields to template variables
-            replacements = {
-                "{{ id }}": axiom.id,
-                "{{ subject }}": axiom.subject,
-                "{{ object }}": axiom.entity,  # Map entity to object
-                "{{ link }}": axiom.trigger,  # Map trigger to link
-                "{{ conditions }}": axiom.conditions,
-                "{{ description }}": axiom.description,
-                # Map category to amendments
-                "{{ amendments }}": f"Category: {axiom.category}",
-            }
-
-            # Apply all replacements
-            for placeholder, value in replacements.items():
-                axiom_section = axiom_section.replace(placeholder, value)
-
-            formatted_constitution += axiom_section + "\n"
-
-        return formatted_constitution
-
-    def _load_and_format_user_prompt(self, question: str) -> str:
+        template_content = load_prompt("constitution.md")
+
+        # Load axiom data once and keep it, so citations can be resolved too
+        if self.axiom_store is None:
+            self.axiom_store = self._load_constitution_data()
+
+        # The store renders every axiom with the template and caches the result
+        return self.axiom_store.formatted_sections(template_content)
+
+    def _load_and_format_constitution_prompt(self) -> str:
         """
-        Load and format the user prompt with constitution and question.
+        Load and format the constitution prompt sent ahead of every question.
 
-        Args:
-            question: The user's question to be answered.
+        The result is cached on the first call.
 
         Returns:
-            Formatted user prompt with constitution and question.
+            Formatted constitution prompt.
         """
-        # Load user prompt template
-        user_prompt_file = root() / "src/core/prompts/user_prompt.md"
-        with open(user_prompt_file, encoding="utf-8") as f:
-            user_prompt_template = f.read()
+        if self._constitution_prompt is not None:
+            return self._constitution_prompt
+
+        # Load constitution prompt template
+        constitution_prompt_template = load_prompt("constitution_prompt.md")
 
         # Get formatted constitution
         constitution = self._load_and_format_constitution()
 
-        # Format user prompt with constitution and question using string replacement
-        formatted_prompt = user_prompt_template.replace(
+        self._constitution_prompt = constitution_prompt_template.replace(
             "{{ constitution }}", constitution
         )
-        formatted_prompt = formatted_prompt.replace("{{ question }}", question)
-
-        return formatted_prompt
+        return self._constitution_prompt
 
     async def invoke(self, question: str) -> str:
         """
@@ -228,12 +254,16 @@ class QAEngine:
         This method:
         1. Loads and formats the constitution with axiom data
         2. Prepares the system prompt (used as agent instructions)
-        3. Formats the user prompt with the question and constitution
+        3. Sends the constitution as a system message followed by the question
+           as the user message
         4. Creates a ChatAgent with system instructions
         5. Streams the response from Azure OpenAI via the Agent Framework
         6. Parses citations in the format [AXIOM-XXX] and yields them as CitationContent
         7. Yields regular text as TextContent
 
+        When the answer cache is enabled, a question asked before (ignoring case
+        and whitespace) is answered from the cache without calling the model.
+
         Args:
             question: The user's question.
 
@@ -244,20 +274,56 @@ class QAEngine:
             TODO: Add support for conversation history with Message list.
             TODO: Add support for reality
         """
-        # Load and format user prompt with constitution and question
-        user_prompt = self._load_and_format_user_prompt(question)
+        # Replay the answer to a question asked before
+        cache_key = " ".join(question.split()).casefold()
+        if self.answer_cache_size and (
+            cached_answer := self._answer_cache.get(cache_key)
+        ):
+            self._answer_cache.move_to_end(cache_key)
+            for chunk in cached_answer:
+                yield chunk
+            return
+
+        # Load and format the constitution prompt. The first call reads and
+        # renders the prompt files, so it runs in a worker thread to keep the
+        # event loop free; afterwards it comes from cache. This only covers the
+        # engine's own lazy loading: a store passed in (as by
+        # dependencies.qa_engine()) is loaded by whoever creates the engine.
+        if self._constitution_prompt is None:
+            constitution_prompt = await asyncio.to_thread(
+                self._load_and_format_constitution_prompt
+            )
+        else:
+            constitution_prompt = self._constitution_prompt
+
+        # The constitution goes in its own system message ahead of the question,
+        # so the (large) start of the request is the same for every question
+        messages = [
+            ChatMessage(role="system", text=constitution_prompt),
+            ChatMessage(role="user", text=question),
+        ]
 
         # Create async generator for streaming chunks
         async def stream() -> AsyncIterator[str]:
-            async for chunk in self.agent.run_stream(user_prompt):
-                if chunk.text:
-                    yield chunk.text
+            async with self._model_call_slots:
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire(
+                        estimate_tokens(
+                            load_prompt("system_prompt.md"),
+                            constitution_prompt,
+                            question,
+                        )
+                    )
+                async for chunk in self.agent.run_stream(messages):
+                    if chunk.text:
+                        yield chunk.text
 
         # Process chunks for citations
+        answer: list[TextContent | CitationContent] = []
         async for chunk in process_chunk(stream()):
             match chunk:
                 case TextContent():
-                    yield chunk
+                    content = chunk
                 case CitationCandidate() as candidate:
                     # Validate citation against axiom store
                     axiom_store = (
@@ -266,7 +332,15 @@ class QAEngine:
                         else None
                     )
                     if axiom_store and (axiom := axiom_store.get(id=candidate.id)):
-                        yield CitationContent(axiom=axiom)
+                        content = CitationContent(axiom=axiom)
                     else:
                         # If axiom not found, yield as plain text
-                        yield TextContent(content=candidate.text)
+                        content = TextContent(content=candidate.text)
+            answer.append(content)
+            yield content
+
+        # Only complete answers are cached
+        if self.answer_cache_size:
+            self._answer_cache[cache_key] = answer
+            if len(self._answer_cache) > self.answer_cache_size:
+                _ = self._answer_cache.popitem(last=False)
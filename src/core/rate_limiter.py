@@ -0,0 +1,114 @@
+"""
+Client-side rate limiting for model requests.
+
+Azure OpenAI deployments have a quota of requests and tokens per minute. Going
+over it is answered with 429 responses, which the client retries after a
+delay. When many questions are sent at once (e.g. during an evaluation run),
+most of them end up in that retry loop. This module spreads the requests over
+time so they stay within the quota instead.
+"""
+
+import asyncio
+
+# Rough number of characters per token, used to estimate prompt sizes
+CHARS_PER_TOKEN = 4
+# Seconds of quota that may be sent at once after a quiet period. Azure OpenAI
+# enforces the per-minute quota over shorter windows, so a whole minute's worth
+# in one burst would still be answered with 429 responses.
+BURST_SECONDS = 10
+
+
+def estimate_tokens(*texts: str) -> int:
+    """
+    Estimate the number of tokens of a prompt.
+
+    Args:
+        texts: Parts of the prompt.
+
+    Returns:
+        Estimated number of tokens.
+    """
+    return sum(len(text) for text in texts) // CHARS_PER_TOKEN
+
+
+class RateLimiter:
+    """
+    Token bucket limiting requests and tokens per minute.
+
+    Both budgets refill continuously and hold at most BURST_SECONDS worth of
+    quota, so only a short burst goes out at once after a quiet period and
+    requests are spread evenly under sustained load. Waiting requests are
+    served in order.
+
+    Attributes:
+        requests_per_minute (int | None): Maximum number of requests per minute.
+        tokens_per_minute (int | None): Maximum number of tokens per minute.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            requests_per_minute: Optional limit of requests per minute.
+            tokens_per_minute: Optional limit of tokens per minute.
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        # Bucket sizes, never less than a single request
+        self._request_capacity = max(
+            1.0, (requests_per_minute or 0) * BURST_SECONDS / 60
+        )
+        self._token_capacity = (tokens_per_minute or 0) * BURST_SECONDS / 60
+        self._requests = self._request_capacity
+        self._tokens = self._token_capacity
+        self._updated: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """
+        Wait until a request of the given size fits in the budget and take it.
+
+        Args:
+            tokens: Estimated number of tokens of the request.
+        """
+        if self.tokens_per_minute:
+            # A request larger than the whole bucket would wait forever
+            tokens = min(tokens, int(self._token_capacity))
+
+        async with self._lock:
+            while (delay := self._delay(tokens)) > 0:
+                await asyncio.sleep(delay)
+            self._requests -= 1
+            self._tokens -= tokens
+
+    def _delay(self, tokens: int) -> float:
+        """
+        Refill the budgets and compute how long until the request fits.
+
+        Args:
+            tokens: Estimated number of tokens of the request.
+
+        Returns:
+            Seconds to wait, 0 if the request fits now.
+        """
+        now = asyncio.get_running_loop().time()
+        elapsed = 0.0 if self._updated is None else now - self._updated
+        self._updated = now
+
+        delay = 0.0
+        if self.requests_per_minute:
+            rate = self.requests_per_minute / 60
+            self._requests = min(
+                self._request_capacity, self._requests + elapsed * rate
+            )
+            delay = max(delay, (1 - self._requests) / rate)
+        if self.tokens_per_minute:
+            rate = self.tokens_per_minute / 60
+            self._tokens = min(self._token_capacity, self._tokens + elapsed * rate)
+            delay = max(delay, (tokens - self._tokens) / rate)
+        return delay
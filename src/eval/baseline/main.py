@@ -1,4 +1,4 @@
-from core.dependencies import qa_engine
+from core.dependencies import qa_engine, warmup
 from eval.main import run_evaluation_with_qa_function
 
 
@@ -29,6 +29,9 @@ def main():
     """
     Main function that runs the baseline evaluation.
     """
+    # Build the QA engine (axiom store, prompts, first token) before the event
+    # loop starts, so the concurrent first answers don't block it doing so
+    warmup()
     run_evaluation_with_qa_function(generate_answer)
 
 
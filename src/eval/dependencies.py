@@ -0,0 +1,15 @@
+from functools import cache
+
+from core.dependencies import azure_chat_openai, rate_limiter
+from eval.llm_evaluator.qa_eval_engine import QAEvalEngine
+
+
+@cache
+def qa_eval_engine() -> QAEvalEngine:
+    """
+    Create and cache the QA Evaluation Engine shared by all metrics.
+
+    The engine shares the rate limiter of the QA engine, since both send their
+    requests to the same deployment.
+    """
+    return QAEvalEngine(chat=azure_chat_openai(), rate_limiter=rate_limiter())
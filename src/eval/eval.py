@@ -1,10 +1,9 @@
 import asyncio
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Protocol
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from core.paths import root
 from eval.metrics.accuracy import get_accuracy
@@ -16,6 +15,9 @@ from eval.metrics.models import (
 )
 from eval.metrics.topic_coverage import get_topic_coverage
 
+# Default number of samples evaluated at the same time
+DEFAULT_MAX_CONCURRENCY = 16
+
 
 class EvaluationSampleInput(BaseModel):
     """
@@ -41,6 +43,10 @@ class EvaluationSampleInput(BaseModel):
     axioms_used: list[str]
 
 
+# Decodes and validates the whole dataset in a single pass
+_SAMPLE_INPUT_LIST = TypeAdapter(list[EvaluationSampleInput])
+
+
 class EvaluationSampleOutput(BaseModel):
     """
     Represents the output of an evaluation sample containing input data, model response,
@@ -254,12 +260,23 @@ async def run_evaluation(
     question_answer_fn: QuestionAnswerFunction,
     input_data_path: Path | None = None,
     ouptput_data_path: Path | None = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
 ) -> None:
     """
     Run the evaluation process with the given data path.
 
+    Samples are processed concurrently, with at most `max_concurrency` of them
+    talking to the model at the same time. Every finished sample is saved to the
+    output path, so running again with the same output path resumes a partial
+    run instead of starting over.
+
     Args:
-        data_path (str): Path to the data file or directory
+        question_answer_fn (QuestionAnswerFunction): Function answering the queries
+        input_data_path (Path | None): Path to the dataset file (defaults to
+            data/eval_dataset.json)
+        ouptput_data_path (Path | None): Directory the results are written to
+            (defaults to a new runs/<timestamp> directory)
+        max_concurrency (int): Maximum number of samples evaluated at once
     """
 
     input_path = input_data_path or root() / "data/eval_dataset.json"
@@ -270,16 +287,28 @@ async def run_evaluation(
     print(f"Running evaluation with data path: {input_path}")
     print(f"Running evaluation with output data path: {output_path}")
 
-    async def process_sample(sample_data: str) -> EvaluationSampleOutput:
-        parsed_input = EvaluationSampleInput.model_validate(sample_data)
+    # Keeps the number of in-flight model requests within the deployment limits
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def process_sample(
+        parsed_input: EvaluationSampleInput,
+    ) -> EvaluationSampleOutput:
+        # Reuse the result of a sample finished by a previous run
+        sample_path = output_path / f"evaluation_{parsed_input.id}.json"
+        if sample_path.exists():
+            return EvaluationSampleOutput.model_validate_json(sample_path.read_text())
+
+        async with semaphore:
+            llm_response = await question_answer_fn(query=parsed_input.query)
 
-        llm_response = await question_answer_fn(query=parsed_input.query)
+            _ = (output_path / f"results_{parsed_input.id}.md").write_text(llm_response)
+            sample_output = await evaluate_answer(parsed_input, llm_response)
 
-        _ = (output_path / f"results_{parsed_input.id}.md").write_text(llm_response)
-        return await evaluate_answer(parsed_input, llm_response)
+        _ = sample_path.write_text(sample_output.model_dump_json(indent=4))
+        return sample_output
 
     evaluation_results = await asyncio.gather(
-        *map(process_sample, json.loads(input_path.read_text()))
+        *map(process_sample, _SAMPLE_INPUT_LIST.validate_json(input_path.read_bytes()))
     )
     result = calculate_stats(evaluation_results)
 
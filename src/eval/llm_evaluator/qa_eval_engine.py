@@ -1,10 +1,12 @@
-from typing import Literal, TypeVar
+from functools import cache
+from pathlib import Path
+from typing import Literal, TypeVar, get_args
 
 from agent_framework.azure import AzureOpenAIChatClient
-from anyio import Path
 from pydantic import BaseModel
 
 from core.qa_engine import QAEngine
+from core.rate_limiter import RateLimiter, estimate_tokens
 from eval.metrics.models import (
     AccuracyEvaluationResults,
     EntityExtraction,
@@ -14,6 +16,14 @@ from eval.metrics.models import (
 T = TypeVar("T", bound=BaseModel)
 
 
+@cache
+def _load_prompt(prompt_type: str) -> str:
+    """Load an evaluation prompt, reading each file from disk only once."""
+    file_path = Path(__file__).parent / "prompts" / f"{prompt_type}_prompt.md"
+    with open(file_path, encoding="utf-8") as f:
+        return f.read()
+
+
 class QAEvalEngine(QAEngine):
     """
     Question-Answering engine for evaluation of health insurance queries.
@@ -41,34 +51,39 @@ class QAEvalEngine(QAEngine):
     def __init__(
         self,
         chat: AzureOpenAIChatClient,
+        rate_limiter: RateLimiter | None = None,
     ):
         """
         Initialize the QA Evaluation Engine.
 
         Args:
-            chat: Azure OpenAI chat client instance for model inference.
+            chat: Azure OpenAI chat client used to create the evaluation agent.
+            rate_limiter: Optional limiter keeping model calls within the
+                deployment's requests and tokens per minute.
         """
-        # Initialize parent class without axiom_store since it's not needed
-        # for evaluation
-        super().__init__(chat, axiom_store=None)
+        # Read every prompt here, so the async evaluation methods never block
+        # the event loop on file reads
+        for prompt_type in get_args(self.PromptTypes):
+            _ = self._get_prompt(prompt_type)
+
+        # Create the agent with the evaluation system prompt once, so model
+        # invocations don't pay any setup cost. The parent class doesn't need
+        # an axiom_store for evaluation.
+        super().__init__(
+            chat.create_agent(instructions=self._get_prompt("system")),
+            axiom_store=None,
+            rate_limiter=rate_limiter,
+        )
 
     def _get_prompt(self, promptType: PromptTypes) -> str:
         """Load prompts."""
-
-        file_path = Path(__file__).parent / "prompts" / f"{promptType}_prompt.md"
-        with open(file_path, encoding="utf-8") as f:
-            return f.read()
+        return _load_prompt(promptType)
 
     async def _perform_model_invocation(self, prompt: str, output_type: type[T]) -> T:
         """Invoke the model and parse the output into the specified Pydantic model."""
 
-        # Load system prompt
-        system_prompt = self._get_prompt("system")
-
-        # Create agent with system instructions if not already created
-        # or if we need to update instructions (reuse parent's pattern)
-        if self.agent is None:
-            self.agent = self.chat.create_agent(instructions=system_prompt)
+        if self.rate_limiter:
+            await self.rate_limiter.acquire(estimate_tokens(prompt))
 
         # Use asyncio to run the async agent with structured output
         response = await self.agent.run(prompt, response_format=output_type)
@@ -1,7 +1,27 @@
 import argparse
 import asyncio
+from pathlib import Path
 
-from eval.eval import QuestionAnswerFunction, run_evaluation
+from eval.eval import DEFAULT_MAX_CONCURRENCY, QuestionAnswerFunction, run_evaluation
+
+
+def positive_int(value: str) -> int:
+    """
+    Parse a command line argument that must be a whole number of at least 1.
+
+    Args:
+        value: Raw argument value.
+
+    Returns:
+        The parsed number.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
 
 
 def run_evaluation_with_qa_function(question_answer_fn: QuestionAnswerFunction):
@@ -20,13 +40,34 @@ def run_evaluation_with_qa_function(question_answer_fn: QuestionAnswerFunction):
             "(optional, defaults to data/eval_dataset.json)"
         ),
     )
+    parser.add_argument(
+        "--output_path",
+        required=False,
+        help=(
+            "Directory the results are written to. Samples already evaluated "
+            "there are reused, so pass the directory of an interrupted run to "
+            "resume it (optional, defaults to a new runs/<timestamp> directory)"
+        ),
+    )
+    parser.add_argument(
+        "--max_concurrency",
+        type=positive_int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=(
+            "Maximum number of samples evaluated at the same time "
+            f"(optional, defaults to {DEFAULT_MAX_CONCURRENCY})"
+        ),
+    )
 
     args = parser.parse_args()
 
     # Run the async evaluation function
     asyncio.run(
         run_evaluation(
-            question_answer_fn=question_answer_fn, input_data_path=args.data_path
+            question_answer_fn=question_answer_fn,
+            input_data_path=Path(args.data_path) if args.data_path else None,
+            ouptput_data_path=Path(args.output_path) if args.output_path else None,
+            max_concurrency=args.max_concurrency,
         )
     )
 
@@ -1,5 +1,4 @@
-from core.dependencies import azure_chat_openai
-from eval.llm_evaluator.qa_eval_engine import QAEvalEngine
+from eval.dependencies import qa_eval_engine
 from eval.metrics.models import AccuracyEvaluationResults, EntityExtraction
 
 
@@ -21,7 +20,6 @@ async def get_accuracy(
     Returns:
         AccuracyEvaluation: The accuracy evaluation results for all entities.
     """
-    qa_eval_engine = QAEvalEngine(chat=azure_chat_openai())
-    return await qa_eval_engine.accuracy_evaluation(
+    return await qa_eval_engine().accuracy_evaluation(
         entity_list, llm_answer, expected_answer
     )
@@ -0,0 +1,107 @@
+"""
+Tests for the axiom store module.
+
+This module tests the AxiomStore class, axiom rendering and loading axioms
+from JSON data.
+"""
+
+import json
+
+import pytest
+
+from core.axiom_store import Axiom, AxiomId, AxiomStore, load_from_json, render_axiom
+
+TEMPLATE = "## {{ id }}\n{{ subject }} / {{ object }} / {{ amendments }}\n"
+
+
+def make_axiom(axiom_id: str) -> Axiom:
+    """Create a test axiom with the given id."""
+    return Axiom(
+        id=AxiomId(axiom_id),
+        subject=f"subject {axiom_id}",
+        entity=f"entity {axiom_id}",
+        trigger=f"trigger {axiom_id}",
+        conditions=f"conditions {axiom_id}",
+        description=f"description {axiom_id}",
+        category=f"category {axiom_id}",
+    )
+
+
+def test_render_axiom_maps_fields_to_placeholders():
+    """Test that render_axiom maps axiom fields to the template variables."""
+    # act
+    result = render_axiom(TEMPLATE, make_axiom("AXIOM-001"))
+
+    # assert
+    assert result == (
+        "## AXIOM-001\n"
+        "subject AXIOM-001 / entity AXIOM-001 / Category: category AXIOM-001\n"
+    )
+
+
+def test_formatted_sections_renders_all_axioms_in_order():
+    """Test that formatted_sections renders every axiom in insertion order."""
+    # arrange
+    store = AxiomStore([make_axiom("AXIOM-001"), make_axiom("AXIOM-002")])
+
+    # act
+    result = store.formatted_sections(TEMPLATE)
+
+    # assert
+    assert result == (
+        render_axiom(TEMPLATE, make_axiom("AXIOM-001"))
+        + "\n"
+        + render_axiom(TEMPLATE, make_axiom("AXIOM-002"))
+        + "\n"
+    )
+
+
+def test_formatted_sections_caches_result_per_template():
+    """Test that formatted_sections only renders once per template."""
+    # arrange
+    store = AxiomStore([make_axiom("AXIOM-001")])
+
+    # act
+    result1 = store.formatted_sections(TEMPLATE)
+    result2 = store.formatted_sections(TEMPLATE)
+    other = store.formatted_sections("{{ id }}")
+
+    # assert
+    assert result1 is result2
+    assert other == "AXIOM-001\n"
+
+
+@pytest.mark.parametrize("encode", [str, str.encode], ids=["str", "bytes"])
+def test_load_from_json_parses_axioms(encode):
+    """Test that load_from_json accepts JSON text or bytes."""
+    # arrange
+    data = json.dumps(
+        [
+            {
+                "id": "AXIOM-001",
+                "subject": "subject",
+                "entity": "entity",
+                "trigger": "trigger",
+                "conditions": "conditions",
+                "description": "description",
+                "category": "category",
+                "amendments": "ignored",
+            }
+        ]
+    )
+
+    # act
+    store = load_from_json(encode(data))
+
+    # assert
+    assert store.list() == [
+        Axiom(
+            id=AxiomId("AXIOM-001"),
+            subject="subject",
+            entity="entity",
+            trigger="trigger",
+            conditions="conditions",
+            description="description",
+            category="category",
+        )
+    ]
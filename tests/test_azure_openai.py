@@ -0,0 +1,273 @@
+"""
+Tests for the Azure OpenAI module.
+
+This module tests the creation of the Azure OpenAI chat client and the
+sharing of bearer token providers between clients.
+"""
+
+import asyncio
+import time
+from pathlib import Path
+from unittest.mock import Mock, create_autospec
+
+import pytest
+from agent_framework.azure import AzureOpenAIChatClient
+from azure.core.credentials import AccessToken, TokenCredential
+
+from core.azure_openai import (
+    COGNITIVE_SERVICES_SCOPE,
+    TOKEN_REFRESH_RETRY_DELAY,
+    BearerTokenProvider,
+    azure_chat_openai_client,
+    bearer_token_provider,
+    warmup_token,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_token_provider_cache():
+    """Clear the token provider cache before and after each test."""
+    bearer_token_provider.cache_clear()
+    yield
+    bearer_token_provider.cache_clear()
+
+
+@pytest.fixture
+def mock_client(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Mock:
+    """Mock the chat client class and isolate the test from any Azure settings."""
+    # Settings are also read from a .env file in the working directory
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("AZURE_OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("AZURE_OPENAI_TOKEN_ENDPOINT", raising=False)
+
+    mock_client = create_autospec(AzureOpenAIChatClient)
+    monkeypatch.setattr("core.azure_openai.AzureOpenAIChatClient", mock_client)
+    return mock_client
+
+
+def test_azure_chat_openai_client_uses_token_provider(mock_client: Mock):
+    """Test that the client authenticates through a bearer token provider."""
+    # arrange
+    credential = Mock(spec=TokenCredential)
+
+    # act
+    result = azure_chat_openai_client(credential)
+
+    # assert
+    provider = mock_client.call_args.kwargs["ad_token_provider"]
+    assert isinstance(provider, BearerTokenProvider)
+    assert provider.token_credential is credential
+    assert provider.scope == COGNITIVE_SERVICES_SCOPE
+    assert result is mock_client.return_value
+
+
+def test_azure_chat_openai_client_uses_configured_token_endpoint(
+    mock_client: Mock, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that tokens are requested for AZURE_OPENAI_TOKEN_ENDPOINT."""
+    # arrange
+    monkeypatch.setenv("AZURE_OPENAI_TOKEN_ENDPOINT", "https://custom/.default")
+
+    # act
+    _ = azure_chat_openai_client(Mock(spec=TokenCredential))
+
+    # assert
+    provider = mock_client.call_args.kwargs["ad_token_provider"]
+    assert provider.scope == "https://custom/.default"
+
+
+def test_azure_chat_openai_client_reads_token_endpoint_from_env_file(
+    mock_client: Mock, tmp_path: Path
+):
+    """Test that the token endpoint in the .env file is used too."""
+    # arrange
+    _ = (tmp_path / ".env").write_text(
+        "AZURE_OPENAI_TOKEN_ENDPOINT=https://custom/.default\n"
+    )
+
+    # act
+    _ = azure_chat_openai_client(Mock(spec=TokenCredential))
+
+    # assert
+    provider = mock_client.call_args.kwargs["ad_token_provider"]
+    assert provider.scope == "https://custom/.default"
+
+
+def test_azure_chat_openai_client_prefers_api_key(
+    mock_client: Mock, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that no token provider is used when an API key is configured."""
+    # arrange
+    monkeypatch.setenv("AZURE_OPENAI_API_KEY", "key")
+    credential = Mock(spec=TokenCredential)
+
+    # act
+    result = azure_chat_openai_client(credential)
+
+    # assert
+    mock_client.assert_called_once_with()
+    credential.get_token.assert_not_called()
+    assert result is mock_client.return_value
+
+
+def test_bearer_token_provider_is_shared_per_credential():
+    """Test that clients created from one credential share a token provider."""
+    # arrange
+    credential = object()
+    other_credential = object()
+
+    # act
+    result1 = bearer_token_provider(credential)
+    result2 = bearer_token_provider(credential)
+    other = bearer_token_provider(other_credential)
+
+    # assert
+    assert result1 is result2
+    assert other is not result1
+
+
+async def test_bearer_token_provider_reuses_valid_token():
+    """Test that concurrent requests share a single token fetch."""
+    # arrange
+    mock_credential = Mock()
+    mock_credential.get_token.return_value = AccessToken(
+        "token", int(time.time()) + 3600
+    )
+    subject = BearerTokenProvider(mock_credential, COGNITIVE_SERVICES_SCOPE)
+
+    # act
+    results = await asyncio.gather(*(subject() for _ in range(5)))
+    result = await subject()
+
+    # assert
+    assert results == ["token"] * 5
+    assert result == "token"
+    mock_credential.get_token.assert_called_once_with(COGNITIVE_SERVICES_SCOPE)
+
+
+async def test_bearer_token_provider_refreshes_expiring_token_in_background():
+    """Test that a token about to expire is returned while a new one is fetched."""
+    # arrange
+    mock_credential = Mock()
+    mock_credential.get_token.side_effect = [
+        AccessToken("old", int(time.time()) + 60),
+        AccessToken("new", int(time.time()) + 3600),
+    ]
+    subject = BearerTokenProvider(mock_credential, COGNITIVE_SERVICES_SCOPE)
+    _ = await subject()
+
+    # act
+    result = await subject()
+    refresh = subject._refresh
+    assert refresh is not None
+    _ = await refresh
+    refreshed = await subject()
+
+    # assert
+    assert result == "old"
+    assert refreshed == "new"
+    assert mock_credential.get_token.call_count == 2
+
+
+async def test_bearer_token_provider_backs_off_after_failed_refresh():
+    """Test that a failed background refresh is not retried by every request."""
+    # arrange
+    mock_credential = Mock()
+    mock_credential.get_token.side_effect = [
+        AccessToken("old", int(time.time()) + 60),
+        RuntimeError("az failed"),
+        AccessToken("new", int(time.time()) + 3600),
+    ]
+    subject = BearerTokenProvider(mock_credential, COGNITIVE_SERVICES_SCOPE)
+    _ = await subject()
+    _ = await subject()
+    failed_refresh = subject._refresh
+    assert failed_refresh is not None
+    with pytest.raises(RuntimeError, match="az failed"):
+        await failed_refresh
+
+    # act
+    during_delay = await subject()
+    started_during_delay = subject._refresh is not None
+    assert subject._refresh_failed_at is not None
+    subject._refresh_failed_at -= TOKEN_REFRESH_RETRY_DELAY
+    after_delay = await subject()
+    retry = subject._refresh
+    assert retry is not None
+    _ = await retry
+
+    # assert
+    assert during_delay == "old"
+    assert not started_during_delay
+    assert after_delay == "old"
+    assert await subject() == "new"
+    assert mock_credential.get_token.call_count == 3
+
+
+async def test_bearer_token_provider_waits_for_expired_token():
+    """Test that an expired token is never handed out."""
+    # arrange
+    mock_credential = Mock()
+    mock_credential.get_token.side_effect = [
+        AccessToken("old", int(time.time()) - 1),
+        AccessToken("new", int(time.time()) + 3600),
+    ]
+    subject = BearerTokenProvider(mock_credential, COGNITIVE_SERVICES_SCOPE)
+    _ = await subject()
+
+    # act
+    result = await subject()
+
+    # assert
+    assert result == "new"
+
+
+async def test_bearer_token_provider_uses_token_from_warmup():
+    """Test that the token fetched by warmup() is used by the first request."""
+    # arrange
+    mock_credential = Mock()
+    mock_credential.get_token.return_value = AccessToken(
+        "token", int(time.time()) + 3600
+    )
+    subject = BearerTokenProvider(mock_credential, COGNITIVE_SERVICES_SCOPE)
+
+    # act
+    subject.warmup()
+    result = await subject()
+
+    # assert
+    assert result == "token"
+    assert subject._refresh is None
+    mock_credential.get_token.assert_called_once_with(COGNITIVE_SERVICES_SCOPE)
+
+
+def test_warmup_token_fetches_token_for_configured_endpoint(
+    mock_client: Mock, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that warmup_token() primes the provider the client will use."""
+    # arrange
+    monkeypatch.setenv("AZURE_OPENAI_TOKEN_ENDPOINT", "https://custom/.default")
+    credential = Mock(spec=TokenCredential)
+    credential.get_token.return_value = AccessToken("token", int(time.time()) + 3600)
+
+    # act
+    warmup_token(credential)
+
+    # assert
+    credential.get_token.assert_called_once_with("https://custom/.default")
+    assert bearer_token_provider(credential, "https://custom/.default")._token
+
+
+def test_warmup_token_skips_token_with_api_key(
+    mock_client: Mock, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that no token is fetched when an API key is configured."""
+    # arrange
+    monkeypatch.setenv("AZURE_OPENAI_API_KEY", "key")
+    credential = Mock(spec=TokenCredential)
+
+    # act
+    warmup_token(credential)
+
+    # assert
+    credential.get_token.assert_not_called()
@@ -5,6 +5,7 @@ This module tests the dependency injection functions and caching behavior
 for the QA Engine components.
 """
 
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
@@ -15,6 +16,8 @@ from core.dependencies import (
     chat_agent,
     credential,
     qa_engine,
+    rate_limiter,
+    warmup,
 )
 
 
@@ -27,15 +30,30 @@ def clear_dependency_caches():
     azure_chat_openai.cache_clear()
     chat_agent.cache_clear()
     axiom_store.cache_clear()
+    rate_limiter.cache_clear()
     qa_engine.cache_clear()
     yield
     credential.cache_clear()
     azure_chat_openai.cache_clear()
     chat_agent.cache_clear()
     axiom_store.cache_clear()
+    rate_limiter.cache_clear()
     qa_engine.cache_clear()
 
 
+@pytest.fixture(autouse=True)
+def isolate_settings(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """Run each test without settings from the environment or a .env file."""
+    monkeypatch.chdir(tmp_path)
+    for name in (
+        "AZURE_OPENAI_REQUESTS_PER_MINUTE",
+        "AZURE_OPENAI_TOKENS_PER_MINUTE",
+        "QA_ENGINE_MAX_CONCURRENCY",
+        "QA_ENGINE_ANSWER_CACHE_SIZE",
+    ):
+        monkeypatch.delenv(name, raising=False)
+
+
 @pytest.fixture(autouse=True)
 def patch_azure_cli_credential():
     """Mock AzureCliCredential to avoid actual authentication."""
@@ -131,7 +149,7 @@ def test_axiom_store_loads_from_json(mock_load_from_json: Mock):
     mock_load_from_json.assert_called_once()
     call_args = mock_load_from_json.call_args[0]
     assert len(call_args) > 0
-    assert isinstance(call_args[0], str)
+    assert isinstance(call_args[0], bytes)
     assert result is not None
 
 
@@ -156,6 +174,92 @@ def test_qa_engine_creates_engine_with_dependencies(mock_load_from_json: Mock):
     mock_load_from_json.assert_called_once()
 
 
+def test_qa_engine_reads_max_concurrency_from_environment(
+    mock_load_from_json: Mock, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that qa_engine() limits concurrency when the variable is set."""
+    # arrange
+    monkeypatch.setenv("QA_ENGINE_MAX_CONCURRENCY", "4")
+
+    # act
+    result = qa_engine()
+
+    # assert
+    assert result.max_concurrency == 4
+
+
+def test_qa_engine_is_not_rate_limited_by_default(mock_load_from_json: Mock):
+    """Test that qa_engine() has no rate limiter when no quota is configured."""
+    # act
+    result = qa_engine()
+
+    # assert
+    assert result.rate_limiter is None
+
+
+def test_qa_engine_reads_rate_limits_from_environment(
+    mock_load_from_json: Mock, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that qa_engine() is rate limited when a quota is configured."""
+    # arrange
+    monkeypatch.setenv("AZURE_OPENAI_TOKENS_PER_MINUTE", "30000")
+
+    # act
+    result = qa_engine()
+
+    # assert
+    assert result.rate_limiter is rate_limiter()
+    assert result.rate_limiter is not None
+    assert result.rate_limiter.requests_per_minute is None
+    assert result.rate_limiter.tokens_per_minute == 30000
+
+
+def test_qa_engine_reads_answer_cache_size_from_environment(
+    mock_load_from_json: Mock, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that qa_engine() caches answers when the variable is set."""
+    # arrange
+    monkeypatch.setenv("QA_ENGINE_ANSWER_CACHE_SIZE", "128")
+
+    # act
+    result = qa_engine()
+
+    # assert
+    assert result.answer_cache_size == 128
+
+
+def test_qa_engine_reads_engine_settings_from_env_file(
+    mock_load_from_json: Mock, tmp_path: Path
+):
+    """Test that the engine settings in the .env file are used."""
+    # arrange
+    _ = (tmp_path / ".env").write_text(
+        "QA_ENGINE_MAX_CONCURRENCY=8\nQA_ENGINE_ANSWER_CACHE_SIZE=32\n"
+    )
+
+    # act
+    result = qa_engine()
+
+    # assert
+    assert result.max_concurrency == 8
+    assert result.answer_cache_size == 32
+
+
+def test_qa_engine_reads_rate_limits_from_env_file(
+    mock_load_from_json: Mock, tmp_path: Path
+):
+    """Test that quotas in the .env file are used like the other settings."""
+    # arrange
+    _ = (tmp_path / ".env").write_text("AZURE_OPENAI_REQUESTS_PER_MINUTE=60\n")
+
+    # act
+    result = qa_engine()
+
+    # assert
+    assert result.rate_limiter is not None
+    assert result.rate_limiter.requests_per_minute == 60
+
+
 def test_qa_engine_caches_result(mock_load_from_json: Mock):
     """Test that qa_engine() caches its result."""
     # act
@@ -167,3 +271,24 @@ def test_qa_engine_caches_result(mock_load_from_json: Mock):
     assert result1 is result2
 
 
+def test_warmup_creates_dependencies_and_renders_prompts(
+    mock_load_from_json: Mock,
+    patch_azure_cli_credential: Mock,
+    patch_azure_chat_openai_client: Mock,
+):
+    """Test that warmup() creates every cached dependency and the first token."""
+    # arrange
+    mock_load_from_json.return_value.formatted_sections.return_value = "axioms"
+
+    # act
+    with patch("core.dependencies.warmup_token") as mock_warmup_token:
+        warmup()
+
+    # assert
+    mock_warmup_token.assert_called_once_with(credential())
+    patch_azure_cli_credential.assert_called_once()
+    patch_azure_chat_openai_client.assert_called_once()
+    mock_load_from_json.assert_called_once()
+    engine = qa_engine()
+    assert engine._constitution_prompt is not None
+    assert "axioms" in engine._constitution_prompt
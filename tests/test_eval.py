@@ -0,0 +1,169 @@
+"""
+Tests for the evaluation runner.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from eval.baseline import main as baseline_main
+from eval.eval import EvaluationSampleOutput, run_evaluation
+from eval.main import run_evaluation_with_qa_function
+from eval.metrics.models import (
+    AccuracyEvaluationResults,
+    EntityExtraction,
+    TopicCoverageEvaluationResults,
+)
+
+
+def make_sample(sample_id: int) -> dict:
+    """Create a raw evaluation sample."""
+    return {
+        "id": sample_id,
+        "query": f"question {sample_id}",
+        "context": "",
+        "expected_answer": "answer",
+        "reasoning": [],
+        "axioms_used": [],
+    }
+
+
+@pytest.fixture
+def input_path(tmp_path: Path) -> Path:
+    """Write a small evaluation dataset to disk."""
+    path = tmp_path / "dataset.json"
+    _ = path.write_text(json.dumps([make_sample(i) for i in range(6)]))
+    return path
+
+
+@pytest.fixture
+def mock_evaluate_answer():
+    """Mock evaluate_answer to avoid calling the evaluation model."""
+
+    async def evaluate(sample_input, llm_answer):
+        return EvaluationSampleOutput(
+            input=sample_input,
+            llm_response=llm_answer,
+            entities=EntityExtraction(
+                user_query_entities=[],
+                llm_answer_entities=[],
+                expected_answer_entities=[],
+            ),
+            accuracy=AccuracyEvaluationResults(entity_accuracies=[], accuracy_mean=1.0),
+            topic_coverage=TopicCoverageEvaluationResults(
+                reason="covered", coverage_score=1.0
+            ),
+        )
+
+    with patch("eval.eval.evaluate_answer", side_effect=evaluate) as mock:
+        yield mock
+
+
+async def test_run_evaluation_limits_concurrent_samples(
+    input_path: Path, tmp_path: Path, mock_evaluate_answer: AsyncMock
+):
+    """Test that no more than max_concurrency samples run at the same time."""
+    # arrange
+    running = 0
+    max_running = 0
+
+    async def question_answer_fn(*, query: str) -> str:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return f"answer to {query}"
+
+    # act
+    await run_evaluation(
+        question_answer_fn=question_answer_fn,
+        input_data_path=input_path,
+        ouptput_data_path=tmp_path / "run",
+        max_concurrency=2,
+    )
+
+    # assert
+    assert max_running == 2
+    assert mock_evaluate_answer.call_count == 6
+    assert (tmp_path / "run" / "evaluation_results.json").exists()
+
+
+async def test_run_evaluation_skips_samples_finished_before(
+    input_path: Path, tmp_path: Path, mock_evaluate_answer: AsyncMock
+):
+    """Test that a second run with the same output path reuses saved samples."""
+    # arrange
+    question_answer_fn = AsyncMock(return_value="answer")
+    output_path = tmp_path / "run"
+    await run_evaluation(
+        question_answer_fn=question_answer_fn,
+        input_data_path=input_path,
+        ouptput_data_path=output_path,
+    )
+    question_answer_fn.reset_mock()
+
+    # act
+    await run_evaluation(
+        question_answer_fn=question_answer_fn,
+        input_data_path=input_path,
+        ouptput_data_path=output_path,
+    )
+
+    # assert
+    question_answer_fn.assert_not_called()
+
+
+def test_run_evaluation_with_qa_function_passes_output_path(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that --output_path is passed on, so an interrupted run can resume."""
+    # arrange
+    question_answer_fn = AsyncMock(return_value="answer")
+    monkeypatch.setattr("sys.argv", ["eval", "--output_path", str(tmp_path / "run")])
+
+    with patch("eval.main.run_evaluation", new_callable=AsyncMock) as mock_run:
+        # act
+        run_evaluation_with_qa_function(question_answer_fn)
+
+    # assert
+    mock_run.assert_awaited_once()
+    assert mock_run.call_args.kwargs["ouptput_data_path"] == tmp_path / "run"
+
+
+def test_baseline_main_warms_up_before_evaluation():
+    """Test that the QA engine is built before the evaluation's event loop runs."""
+    # arrange
+    calls = MagicMock()
+
+    with (
+        patch.object(baseline_main, "warmup", calls.warmup),
+        patch.object(
+            baseline_main, "run_evaluation_with_qa_function", calls.run_evaluation
+        ),
+    ):
+        # act
+        baseline_main.main()
+
+    # assert
+    assert [name for name, _, _ in calls.mock_calls] == ["warmup", "run_evaluation"]
+
+
+@pytest.mark.parametrize("max_concurrency", ["0", "-1", "two"])
+def test_run_evaluation_with_qa_function_rejects_invalid_max_concurrency(
+    max_concurrency: str, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that --max_concurrency below 1 is rejected instead of hanging."""
+    # arrange
+    monkeypatch.setattr("sys.argv", ["eval", "--max_concurrency", max_concurrency])
+
+    with patch("eval.main.run_evaluation", new_callable=AsyncMock) as mock_run:
+        # act
+        with pytest.raises(SystemExit):
+            run_evaluation_with_qa_function(AsyncMock())
+
+    # assert
+    mock_run.assert_not_called()
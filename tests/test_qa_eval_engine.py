@@ -0,0 +1,101 @@
+"""
+Tests for the QA Evaluation Engine module.
+
+This module tests the QAEvalEngine class, including agent creation and
+structured model invocations.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from agent_framework.azure import AzureOpenAIChatClient
+
+from eval.dependencies import qa_eval_engine
+from eval.llm_evaluator.qa_eval_engine import QAEvalEngine, _load_prompt
+from eval.metrics.models import EntityExtraction
+
+
+def test_init_creates_agent_with_system_prompt():
+    """Test that the evaluation agent is created once with the system prompt."""
+    # Arrange
+    mock_chat = MagicMock(spec=AzureOpenAIChatClient)
+
+    # Act
+    subject = QAEvalEngine(mock_chat)
+
+    # Assert
+    mock_chat.create_agent.assert_called_once()
+    instructions = mock_chat.create_agent.call_args.kwargs["instructions"]
+    assert instructions == subject._get_prompt("system")
+    assert subject.agent is mock_chat.create_agent.return_value
+
+
+@pytest.mark.asyncio
+async def test_entity_extraction_reuses_agent():
+    """Test that repeated evaluations run on the agent created at init."""
+    # Arrange
+    mock_chat = MagicMock(spec=AzureOpenAIChatClient)
+    expected = EntityExtraction(
+        user_query_entities=[],
+        llm_answer_entities=[],
+        expected_answer_entities=[],
+    )
+    mock_agent = mock_chat.create_agent.return_value
+    mock_agent.run = AsyncMock(return_value=MagicMock(value=expected))
+
+    subject = QAEvalEngine(mock_chat)
+
+    # Act
+    result1 = await subject.entity_extraction("query", "answer", "expected")
+    result2 = await subject.entity_extraction("query", "answer", "expected")
+
+    # Assert
+    assert result1 is expected
+    assert result2 is expected
+    mock_chat.create_agent.assert_called_once()
+    assert mock_agent.run.await_count == 2
+    assert mock_agent.run.call_args.kwargs["response_format"] is EntityExtraction
+
+
+def test_get_prompt_reads_each_file_once():
+    """Test that evaluation prompts are cached after the first read."""
+    # Arrange
+    subject = QAEvalEngine(MagicMock(spec=AzureOpenAIChatClient))
+
+    # Act
+    first = subject._get_prompt("accuracy")
+    second = subject._get_prompt("accuracy")
+
+    # Assert
+    assert "{entity_list}" in first
+    assert first is second
+
+
+def test_init_reads_every_prompt():
+    """Test that no prompt file is read after the engine is created."""
+    # Arrange
+    _load_prompt.cache_clear()
+
+    # Act
+    _ = QAEvalEngine(MagicMock(spec=AzureOpenAIChatClient))
+
+    # Assert
+    # accuracy, entity_extraction, system and topic_coverage
+    assert _load_prompt.cache_info().currsize == 4
+
+
+def test_qa_eval_engine_is_shared():
+    """Test that every metric gets the same cached evaluation engine."""
+    # Arrange
+    qa_eval_engine.cache_clear()
+
+    # Act
+    with patch("eval.dependencies.azure_chat_openai") as mock_azure_chat_openai:
+        first = qa_eval_engine()
+        second = qa_eval_engine()
+    qa_eval_engine.cache_clear()
+
+    # Assert
+    assert first is second
+    mock_azure_chat_openai.assert_called_once()
+    mock_azure_chat_openai.return_value.create_agent.assert_called_once()
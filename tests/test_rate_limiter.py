@@ -0,0 +1,116 @@
+"""
+Tests for the rate limiter module.
+"""
+
+import asyncio
+
+import pytest
+
+from core.rate_limiter import BURST_SECONDS, RateLimiter, estimate_tokens
+
+
+def test_estimate_tokens():
+    """Test that token estimates add up all parts of the prompt."""
+    # act
+    result = estimate_tokens("a" * 40, "b" * 20)
+
+    # assert
+    assert result == 15
+
+
+async def test_acquire_without_limits_does_not_wait():
+    """Test that a limiter without limits lets every request through."""
+    # arrange
+    subject = RateLimiter()
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    # act
+    for _ in range(100):
+        await subject.acquire(tokens=1000)
+
+    # assert
+    assert loop.time() - start < 0.1
+
+
+real_sleep = asyncio.sleep
+
+
+class FakeClock:
+    """Event loop clock that only moves when the rate limiter sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.delays: list[float] = []
+
+    def time(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.delays.append(delay)
+        self.now += delay
+        await real_sleep(0)
+
+
+@pytest.fixture
+async def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Replace the loop clock and asyncio.sleep so waits are recorded, not slept."""
+    fake = FakeClock()
+    monkeypatch.setattr(asyncio.get_running_loop(), "time", fake.time)
+    monkeypatch.setattr("core.rate_limiter.asyncio.sleep", fake.sleep)
+    return fake
+
+
+async def test_acquire_starts_with_a_short_burst(clock: FakeClock):
+    """Test that only BURST_SECONDS worth of quota is available up front."""
+    # arrange
+    # 60 requests per minute allow a burst of 10 requests, then one per second
+    subject = RateLimiter(requests_per_minute=60)
+
+    # act
+    for _ in range(BURST_SECONDS + 1):
+        await subject.acquire()
+
+    # assert
+    assert clock.delays == [pytest.approx(1.0)]
+
+
+async def test_acquire_spreads_requests_over_time(clock: FakeClock):
+    """Test that requests beyond the budget wait for a refill."""
+    # arrange
+    # 600 requests per minute refill one request every 0.1 seconds
+    subject = RateLimiter(requests_per_minute=600)
+    subject._requests = 1
+
+    # act
+    await asyncio.gather(*(subject.acquire() for _ in range(3)))
+
+    # assert
+    assert clock.delays == [pytest.approx(0.1), pytest.approx(0.1)]
+
+
+async def test_acquire_waits_for_token_budget(clock: FakeClock):
+    """Test that a request waits until enough tokens are available."""
+    # arrange
+    # 60000 tokens per minute refill 1000 tokens every second
+    subject = RateLimiter(tokens_per_minute=60000)
+    subject._tokens = 0
+
+    # act
+    await subject.acquire(tokens=100)
+
+    # assert
+    assert clock.delays == [pytest.approx(0.1)]
+
+
+async def test_acquire_caps_requests_larger_than_budget(clock: FakeClock):
+    """Test that a request larger than the whole bucket is not stuck forever."""
+    # arrange
+    subject = RateLimiter(tokens_per_minute=60000)
+
+    # act
+    await subject.acquire(tokens=1_000_000)
+
+    # assert
+    assert clock.delays == []
+    assert subject._tokens == pytest.approx(0)